@@ -0,0 +1,50 @@
+import importlib.machinery
+import importlib.util
+import os
+
+BREW_FILE = os.path.join(os.path.dirname(os.path.dirname(
+    os.path.abspath(__file__))), "bin", "brew-file")
+
+
+def load_brew_file():
+    loader = importlib.machinery.SourceFileLoader("brew_file", BREW_FILE)
+    spec = importlib.util.spec_from_loader("brew_file", loader)
+    module = importlib.util.module_from_spec(spec)
+    loader.exec_module(module)
+    return module
+
+
+def test_parse_deps_tapped_formula():
+    bf = load_brew_file()
+    all_deps = bf._parse_deps([
+        "user/tap/foo: bar user/tap/baz",
+        "bar:",
+        "user/tap/baz: bar",
+    ])
+    assert all_deps["user/tap/foo"] == ["bar", "user/tap/baz"]
+    assert all_deps["foo"] == ["bar", "user/tap/baz"]
+    assert all_deps["baz"] == ["bar"]
+    assert all_deps["bar"] == []
+
+
+def test_make_pack_deps_tapped_formula():
+    bf = load_brew_file()
+
+    class Dummy:
+        opt = {"verbose": 0}
+
+        def get(self, name):
+            return ["foo", "bar", "baz", "qux"]
+
+        def proc(self, cmd, **kw):
+            assert cmd == "brew deps --installed --1"
+            return 0, ["user/tap/foo: bar user/tap/baz",
+                       "bar:",
+                       "user/tap/baz: bar",
+                       "qux:"]
+
+    b = Dummy()
+    bf.BrewFile.make_pack_deps(b)
+    assert b.pack_deps == {"foo": ["bar", "baz"], "bar": [], "baz": ["bar"],
+                           "qux": []}
+    assert b.top_packs == ["foo", "qux"]